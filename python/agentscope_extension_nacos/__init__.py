@@ -83,6 +83,7 @@ from agentscope_extension_nacos.nacos_react_agent import (
 # =============================================================================
 from agentscope_extension_nacos.utils import (
     AsyncRWLock,
+    coalesce_config_listener,
     validate_agent_name,
     get_first_non_loopback_ip,
     generate_url_from_endpoint,
@@ -106,6 +107,7 @@ __all__ = [
     "NacosReActAgent",
     # Utilities
     "AsyncRWLock",
+    "coalesce_config_listener",
     "validate_agent_name",
     "get_first_non_loopback_ip",
     "generate_url_from_endpoint",
@@ -4,6 +4,7 @@ import weakref
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Literal, Optional
 
+import httpx
 import mcp
 from agentscope.mcp import MCPClientBase, MCPToolFunction, StatefulClientBase
 from agentscope.tool import ToolResponse, Toolkit
@@ -30,6 +31,49 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+class _SharedTransport(httpx.AsyncBaseTransport):
+	"""Transport proxy that leaves the shared transport open on close.
+
+	The MCP transports close their httpx client when a session ends, which
+	would also close the connection pool it was built on.
+	"""
+
+	def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+		self._transport = transport
+
+	async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+		return await self._transport.handle_async_request(request)
+
+	async def aclose(self) -> None:
+		pass
+
+
+def _shared_transport_client_factory(transport: httpx.AsyncBaseTransport):
+	"""Build an ``httpx_client_factory`` whose clients share one connection pool.
+
+	Mirrors ``mcp.shared._httpx_utils.create_mcp_http_client`` apart from the
+	transport, so every MCP session reuses the keep-alive connections of
+	``transport`` instead of opening its own pool.
+	"""
+
+	def factory(
+		headers: dict[str, str] | None = None,
+		timeout: httpx.Timeout | None = None,
+		auth: httpx.Auth | None = None,
+	) -> httpx.AsyncClient:
+		kwargs: dict[str, Any] = {
+			"follow_redirects": True,
+			"timeout": timeout if timeout is not None else httpx.Timeout(30.0),
+			"transport": _SharedTransport(transport),
+		}
+		if headers is not None:
+			kwargs["headers"] = headers
+		if auth is not None:
+			kwargs["auth"] = auth
+		return httpx.AsyncClient(**kwargs)
+
+	return factory
+
 
 class NacosMCPClientBase(MCPClientBase, ABC):
 	"""Base class for Nacos-based MCP (Model Context Protocol) clients.
@@ -62,6 +106,7 @@ class NacosMCPClientBase(MCPClientBase, ABC):
 		self.mcp_server_detail_info: McpServerDetailInfo | None = None
 		self._tools: List[mcp.types.Tool] = []
 		self._tools_meta = {}
+		self.subscribe_param: SubscribeMcpServerParam | None = None
 		
 		# Use weak reference set to store Toolkit observers, avoiding circular references
 		self._toolkit_refs: weakref.WeakSet['Toolkit'] = weakref.WeakSet()
@@ -423,7 +468,11 @@ class NacosMCPClientBase(MCPClientBase, ABC):
 		return True
 
 	async def shutdown(self):
-		pass
+		"""Unsubscribe from MCP server updates in Nacos."""
+		if self.nacos_ai_service is not None and self.subscribe_param is not None:
+			await self.nacos_ai_service.unsubscribe_mcp_server(self.subscribe_param)
+			self.subscribe_param = None
+			logger.debug(f"[{self.__class__.__name__}] Unsubscribed from MCP server updates for: {self.name}")
 
 
 class NacosHttpStatelessClient(NacosMCPClientBase):
@@ -437,6 +486,7 @@ class NacosHttpStatelessClient(NacosMCPClientBase):
 		- No persistent connection overhead
 		- Simple lifecycle management
 		- Automatic cleanup after each operation
+		- Optional shared httpx transport so calls reuse keep-alive connections
 	"""
 	
 	stateful: bool = False
@@ -448,6 +498,7 @@ class NacosHttpStatelessClient(NacosMCPClientBase):
 			headers: dict[str, str] | None = None,
 			timeout: float = 30,
 			sse_read_timeout: float = 60 * 5,
+			transport: httpx.AsyncBaseTransport | None = None,
 			**client_kwargs: Any,
 	) -> None:
 		super().__init__(name=name,
@@ -459,6 +510,9 @@ class NacosHttpStatelessClient(NacosMCPClientBase):
 			"sse_read_timeout": sse_read_timeout,
 			**client_kwargs,
 		}
+		if transport is not None:
+			self.client_config["httpx_client_factory"] = \
+				_shared_transport_client_factory(transport)
 
 	def get_supported_transport(self) -> List[str]:
 		return ["mcp-sse", "mcp-streamable"]
@@ -603,6 +657,7 @@ class NacosHttpStatefulClient(NacosStatefulClientBase):
 			headers: dict[str, str] | None = None,
 			timeout: float = 30,
 			sse_read_timeout: float = 60 * 5,
+			transport: httpx.AsyncBaseTransport | None = None,
 			**client_kwargs: Any,
 	) -> None:
 		super().__init__(nacos_client_config=nacos_client_config,
@@ -613,6 +668,9 @@ class NacosHttpStatefulClient(NacosStatefulClientBase):
 			"sse_read_timeout": sse_read_timeout,
 			**client_kwargs,
 		}
+		if transport is not None:
+			self.client_config["httpx_client_factory"] = \
+				_shared_transport_client_factory(transport)
 
 	async def _async_init(self):
 		"""
@@ -1,7 +1,7 @@
 import asyncio
 import json
 import logging
-from typing import Any, AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Awaitable, Callable, Optional
 
 from agentscope.formatter import (
 	AnthropicChatFormatter,
@@ -28,7 +28,7 @@ from agentscope.model import (
 from v2.nacos import ClientConfig, ConfigParam, NacosConfigService
 
 from agentscope_extension_nacos.nacos_service_manager import NacosServiceManager
-from agentscope_extension_nacos.utils import AsyncRWLock, validate_agent_name
+from agentscope_extension_nacos.utils import AsyncRWLock, coalesce_config_listener, validate_agent_name
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -92,6 +92,11 @@ class NacosChatModel(ChatModelBase):
 		self.model_provider = "openai"
 		self.base_url = ""
 		self._backup_model: ChatModelBase | None = backup_model
+
+		# Callbacks awaited after a model.json change has been applied
+		self._change_callbacks: list[Callable[..., Awaitable[None]]] = []
+		# Registered model.json listener, kept so it can be removed again
+		self._model_config_listener = None
 		
 		logger.debug(f"[{self.__class__.__name__}] Initialized for agent: {agent_name}")
 
@@ -193,11 +198,18 @@ class NacosChatModel(ChatModelBase):
 					raise Exception(
 						f"Failed to create chat model for agent {self.agent_name}: {e}")
 
+			for callback in list(self._change_callbacks):
+				try:
+					await callback(tenant, data_id, group, content)
+				except Exception as e:
+					logger.error(f"[{self.__class__.__name__}] Model change callback failed: {e}", exc_info=True)
 
+		# Rebuild the model once per burst of edits instead of once per push
+		self._model_config_listener = coalesce_config_listener(user_model_config_listener)
 		await self.nacos_config_service.add_listener(
 				data_id=user_model_config_data_id,
 				group=user_model_config_group_name,
-				listener=user_model_config_listener)
+				listener=self._model_config_listener)
 		logger.debug(f"[{self.__class__.__name__}] Registered user model config listener")
 	
 	async def initialize(self):
@@ -264,6 +276,25 @@ class NacosChatModel(ChatModelBase):
 			self.chat_model = chat_model
 			logger.debug(f"[{self.__class__.__name__}] Chat model updated")
 
+	def add_change_callback(self, callback: Callable[..., Awaitable[None]]):
+		"""Register a callback awaited after a model configuration change is applied.
+		
+		Args:
+			callback: Async callback with the Nacos config listener signature
+				``(tenant, data_id, group, content)``
+		"""
+		if callback not in self._change_callbacks:
+			self._change_callbacks.append(callback)
+
+	def remove_change_callback(self, callback: Callable[..., Awaitable[None]]):
+		"""Remove a callback registered with add_change_callback().
+		
+		Args:
+			callback: The callback to remove
+		"""
+		if callback in self._change_callbacks:
+			self._change_callbacks.remove(callback)
+
 	def set_backup_model(self, backup_model: ChatModelBase):
 		"""Set the backup model to use when primary model fails.
 		
@@ -311,6 +342,19 @@ class NacosChatModel(ChatModelBase):
 		async with self.model_lock.read_lock():
 			return await self.chat_model(*args, **kwargs)
 
+	async def remove_config_listener(self):
+		"""Stop listening for model configuration changes.
+		
+		Unlike close(), this leaves the shared Nacos config service running.
+		"""
+		if self.nacos_config_service is not None and self._model_config_listener is not None:
+			await self.nacos_config_service.remove_listener(
+					data_id="model.json",
+					group=f"ai-agent-{self.agent_name}",
+					listener=self._model_config_listener)
+			self._model_config_listener = None
+			logger.debug(f"[{self.__class__.__name__}] Removed user model config listener")
+
 	async def close(self):
 		"""Close connection and clean up resources"""
 		if self.nacos_config_service:
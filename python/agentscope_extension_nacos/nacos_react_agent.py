@@ -1,7 +1,8 @@
 import asyncio
 import json
 import logging
-from typing import Literal, Optional
+import weakref
+from typing import Awaitable, Callable, Literal, Optional
 
 from agentscope.agent import ReActAgent
 from agentscope.memory import LongTermMemoryBase, MemoryBase
@@ -15,6 +16,7 @@ from agentscope_extension_nacos.mcp.agentscope_dynamic_toolkit import DynamicToo
 from agentscope_extension_nacos.mcp.agentscope_nacos_mcp import NacosHttpStatelessClient
 from agentscope_extension_nacos.model.nacos_chat_model import AutoFormatter, NacosChatModel
 from agentscope_extension_nacos.nacos_service_manager import NacosServiceManager
+from agentscope_extension_nacos.utils import coalesce_config_listener
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -45,9 +47,15 @@ class NacosAgentListener:
 		listener = NacosAgentListener(agent_name="my_agent")
 		await listener.initialize()
 		agent = NacosReActAgent(nacos_agent_listener=listener, name="my_agent")
+		
+		# Or share one initialized listener per (config, agent) in the process
+		listener = await NacosAgentListener.get_or_create(agent_name="my_agent")
 		```
 	"""
 	
+	# Shared listeners created by get_or_create(), keyed by (id(config), agent_name)
+	_instances: dict[tuple, 'NacosAgentListener'] = {}
+	
 	def __init__(
 		self,
 		agent_name: str,
@@ -72,7 +80,7 @@ class NacosAgentListener:
 		self.toolkit: DynamicToolkit | None = None
 		self.chat_model: NacosChatModel | None = None
 		self.formatter: AutoFormatter | None = None
-		self.agent: ReActAgent | None = None
+		self.agent: ReActAgent | None = None  # Most recently attached agent
 		
 		# MCP server management
 		self.mcp_servers: list[dict] = []
@@ -89,10 +97,17 @@ class NacosAgentListener:
 		self._init_lock = asyncio.Lock()
 		self._init_task = None  # For storing pre-initialization task
 
-		self._original_model = None
-		self._original_formatter = None
-		self._original_prompt = None
-		self._original_toolkit = None
+		# Attached agents mapped to the components they had before attaching.
+		# Weak keys, so agents built per request are released with their owner.
+		self._attached_agents: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+		# In-process subscribers notified after configuration changes are applied
+		self._subscribers: list[Callable[..., Awaitable[None]]] = []
+
+		# Registered prompt listeners, kept so shutdown() can remove them
+		self._prompt_listener = None
+		self._prompt_config_listener = None
+		self._closed = False
 		
 		logger.debug(f"[{self.__class__.__name__}] Initialized for agent: {agent_name}")
 		
@@ -125,13 +140,154 @@ class NacosAgentListener:
 		"""
 		await self._ensure_initialized()
 
+	@classmethod
+	async def get_or_create(
+		cls,
+		agent_name: str,
+		nacos_client_config: Optional[ClientConfig] = None,
+		**kwargs,
+	) -> 'NacosAgentListener':
+		"""Get the shared, initialized listener for an agent, creating it if needed.
+		
+		Listeners are cached per process by ``(id(nacos_client_config), agent_name)``,
+		so every caller watching the same agent shares one set of Nacos
+		subscriptions. Use attach_subscriber() to be notified of changes.
+		
+		Sharing covers the Nacos subscriptions only: every agent attached to the
+		listener keeps its own original components, see attach_agent().
+		
+		Args:
+			agent_name: Name of the agent
+			nacos_client_config: Nacos client configuration. If not provided, uses global config
+			**kwargs: Extra constructor arguments, only used when creating the listener
+			
+		Returns:
+			NacosAgentListener: The initialized shared listener
+		"""
+		key = (id(nacos_client_config), agent_name)
+		listener = cls._instances.get(key)
+		if listener is None:
+			listener = cls(agent_name=agent_name,
+						   nacos_client_config=nacos_client_config,
+						   **kwargs)
+			cls._instances[key] = listener
+			logger.debug(f"[{cls.__name__}] Created shared listener for agent: {agent_name}")
+		try:
+			await listener.initialize()
+		except Exception:
+			# Do not hand out a listener that failed to initialize; let the next call retry
+			if cls._instances.get(key) is listener:
+				del cls._instances[key]
+			raise
+		return listener
+
+	@classmethod
+	async def release(
+		cls,
+		agent_name: str,
+		nacos_client_config: Optional[ClientConfig] = None,
+	) -> bool:
+		"""Shut down and drop the shared listener created by get_or_create(), if any.
+		
+		The listener's Nacos subscriptions are removed and its agents detached
+		(see shutdown()); the next get_or_create() call for the same key builds
+		a new listener.
+		
+		Args:
+			agent_name: Name of the agent
+			nacos_client_config: The config passed to get_or_create()
+			
+		Returns:
+			bool: True if a cached listener was released
+		"""
+		listener = cls._instances.pop((id(nacos_client_config), agent_name), None)
+		if listener is None:
+			return False
+		await listener.shutdown()
+		logger.debug(f"[{cls.__name__}] Released shared listener for agent: {agent_name}")
+		return True
+
+	async def shutdown(self):
+		"""Stop receiving Nacos configuration updates.
+		
+		Detaches all agents, removes the prompt and model config listeners and
+		unsubscribes the MCP clients this listener created. The Nacos services
+		from NacosServiceManager stay open, since other components share them.
+		"""
+		self._closed = True
+		self.detach_agent()
+		self._subscribers.clear()
+
+		if self.nacos_config_service is not None:
+			if self._prompt_config_listener is not None:
+				await self.nacos_config_service.remove_listener(
+						data_id="prompt.json",
+						group=f"ai-agent-{self.agent_name}",
+						listener=self._prompt_config_listener)
+			if self._prompt_listener is not None and self.user_prompt_ref:
+				await self.nacos_config_service.remove_listener(
+						data_id=self.user_prompt_ref,
+						group="nacos-ai-prompt",
+						listener=self._prompt_listener)
+		self._prompt_listener = None
+		self._prompt_config_listener = None
+		self.user_prompt_ref = ""
+
+		if self.chat_model is not None:
+			self.chat_model.remove_change_callback(self._notify_subscribers)
+			await self.chat_model.remove_config_listener()
+
+		if self.mcp_server_clients:
+			if self.toolkit is not None:
+				await self.toolkit.remove_mcp_clients(list(self.mcp_server_clients))
+			for mcp_client in self.mcp_server_clients.values():
+				await mcp_client.shutdown()
+			self.mcp_server_clients.clear()
+
+		logger.info(f"[{self.__class__.__name__}] Shut down listener for agent: {self.agent_name}")
+
+	def attach_subscriber(self, callback: Callable[..., Awaitable[None]]):
+		"""Subscribe to configuration changes handled by this listener.
+		
+		The callback is awaited with ``(tenant, data_id, group, content)`` after
+		a change to prompt.json, the referenced prompt or model.json has been
+		applied.
+		
+		Args:
+			callback: Async callback with the Nacos config listener signature
+		"""
+		if callback not in self._subscribers:
+			self._subscribers.append(callback)
+			logger.debug(f"[{self.__class__.__name__}] Subscriber attached ({len(self._subscribers)} total)")
+
+	def detach_subscriber(self, callback: Callable[..., Awaitable[None]]):
+		"""Remove a subscriber registered with attach_subscriber().
+		
+		Args:
+			callback: The callback to remove
+		"""
+		if callback in self._subscribers:
+			self._subscribers.remove(callback)
+			logger.debug(f"[{self.__class__.__name__}] Subscriber detached ({len(self._subscribers)} total)")
+
+	async def _notify_subscribers(self, tenant, data_id, group, content):
+		"""Fan a configuration change out to all in-process subscribers."""
+		# Iterate over a snapshot so callbacks may attach or detach subscribers
+		for callback in list(self._subscribers):
+			try:
+				await callback(tenant, data_id, group, content)
+			except Exception as e:
+				logger.error(f"[{self.__class__.__name__}] Subscriber failed for data_id {data_id}: {e}", exc_info=True)
+
 
 	def _set_prompt(self,prompt:str):
-		if prompt is None or prompt == "" and self._original_prompt is not None:
-			prompt = self._original_prompt
 		self.prompt = prompt
-		if self.agent is not None:
-			self.agent._sys_prompt = prompt
+		for agent, originals in list(self._attached_agents.items()):
+			# Fall back to the agent's own prompt when Nacos has none
+			if (prompt is None or prompt == "") and originals["prompt"] is not None:
+				agent._sys_prompt = originals["prompt"]
+			else:
+				agent._sys_prompt = prompt
 
 	def is_initialized(self):
 		return self._initialized
@@ -148,6 +304,9 @@ class NacosAgentListener:
 		if self._initializing:
 			while self._initializing:
 				await asyncio.sleep(0.01)
+			if not self._initialized:
+				# The concurrent initialization failed; do not report success
+				raise RuntimeError(f"NacosAgentListener initialization failed for agent: {self.agent_name}")
 			return
 
 		async with self._init_lock:
@@ -183,29 +342,47 @@ class NacosAgentListener:
 			self._nacos_client_config)
 		logger.debug(f"[{self.__class__.__name__}] Obtained Nacos services for agent: {self.agent_name}")
 
+		# model.json, mcp-server.json and prompt.json are independent, so load
+		# them concurrently over the shared config service connection instead
+		# of paying one round trip after another.
+		init_tasks = []
 		if self._listen_chat_model:
-			self.chat_model = NacosChatModel(
-				nacos_client_config=self._nacos_client_config,
-				agent_name=self.agent_name,
-				stream=True,
-			)
-			await self.chat_model.initialize()
-
-		
-			self.formatter = AutoFormatter(if_multi_agent=False,
-									  chat_model=self.chat_model)
-			logger.debug(f"[{self.__class__.__name__}] Formatter and Chat model initialized")
+			init_tasks.append(self._init_chat_model())
 		if self._listen_mcp_server:
 			self.toolkit = DynamicToolkit()
 			logger.debug(f"[{self.__class__.__name__}] Toolkit created")
-
-			await self._init_listen_mcp_server()
-
+			init_tasks.append(self._init_listen_mcp_server())
 		if self._listen_prompt:
-			await self._init_listen_prompt()
+			init_tasks.append(self._init_listen_prompt())
+
+		tasks = [asyncio.ensure_future(init_task) for init_task in init_tasks]
+		try:
+			await asyncio.gather(*tasks)
+		except BaseException:
+			# Stop sibling loaders so a failed listener does not keep adding
+			# Nacos subscriptions and MCP clients in the background
+			for task in tasks:
+				task.cancel()
+			await asyncio.gather(*tasks, return_exceptions=True)
+			raise
 
 		logger.info(f"[{self.__class__.__name__}] Listeners configured for agent: {self.agent_name}")
 
+	async def _init_chat_model(self):
+		"""Initialize the Nacos-managed chat model and its formatter."""
+		self.chat_model = NacosChatModel(
+			nacos_client_config=self._nacos_client_config,
+			agent_name=self.agent_name,
+			stream=True,
+		)
+		await self.chat_model.initialize()
+		# Fan model.json changes out to subscribers like prompt changes
+		self.chat_model.add_change_callback(self._notify_subscribers)
+
+		self.formatter = AutoFormatter(if_multi_agent=False,
+								  chat_model=self.chat_model)
+		logger.debug(f"[{self.__class__.__name__}] Formatter and Chat model initialized")
+
 
 	async def _init_listen_prompt(self):
 		"""Initialize prompt configuration and set up listeners.
@@ -216,15 +393,23 @@ class NacosAgentListener:
 
 		async def user_prompt_listener(tenant, data_id, group, content):
 			"""Listener for prompt content changes"""
+			if self._closed or data_id != self.user_prompt_ref:
+				# A coalesced push for a prompt ref that has since been replaced
+				logger.debug(
+					f"[{self.__class__.__name__}] Ignoring stale prompt change - data_id: {data_id}")
+				return
 			logger.info(
 				f"[{self.__class__.__name__}] Prompt content changed - data_id: {data_id}")
 			_user_prompt_dict = json.loads(content)
 			self.template = _user_prompt_dict["template"]
 			self._set_prompt(self.template)
 			logger.debug(f"[{self.__class__.__name__}] Prompt updated")
+			await self._notify_subscribers(tenant, data_id, group, content)
 
 		async def user_prompt_config_listener(tenant, data_id, group, content):
 			"""Listener for prompt reference changes"""
+			if self._closed:
+				return
 			logger.info(
 				f"[{self.__class__.__name__}] Prompt config changed - data_id: {data_id}")
 			_user_prompt_config_dict = json.loads(content)
@@ -267,7 +452,14 @@ class NacosAgentListener:
 					if "prompt" in _user_prompt_config_dict:
 						self.template = _user_prompt_config_dict["prompt"]
 			self._set_prompt(self.template)
+			await self._notify_subscribers(tenant, data_id, group, content)
 
+		# Apply bursts of prompt edits once; the config listener resolves
+		# user_prompt_listener at call time, so it also gets the wrapped one
+		user_prompt_listener = coalesce_config_listener(user_prompt_listener)
+		user_prompt_config_listener = coalesce_config_listener(user_prompt_config_listener)
+		self._prompt_listener = user_prompt_listener
+		self._prompt_config_listener = user_prompt_config_listener
 
 		user_config_group_name = f"ai-agent-{self.agent_name}"
 		user_prompt_config_data_id = "prompt.json"
@@ -346,6 +538,10 @@ class NacosAgentListener:
 	def attach_agent(self, agent: ReActAgent):
 		"""Attach Agent to Listener to receive Nacos configuration updates.
 		
+		Several agents may be attached to one listener (e.g. agents built per
+		request on a shared listener). Each one keeps its own original prompt,
+		model, formatter and toolkit, restored by detach_agent().
+		
 		Note: Listener must be initialized before calling this method.
 		
 		Args:
@@ -357,53 +553,63 @@ class NacosAgentListener:
 		if not self.is_initialized():
 			raise RuntimeError("NacosAgentListener not initialized. Call await listener.initialize() first.")
 		
-		self.agent = agent
+		if agent in self._attached_agents:
+			logger.debug(f"[{self.__class__.__name__}] Agent '{agent.name}' already attached")
+			return
 		logger.info(f"[{self.__class__.__name__}] Attaching agent: {agent.name}")
 
-		self._original_prompt = self.agent._sys_prompt
-		self._original_toolkit = self.agent.toolkit
-		self._original_model = self.agent.model
-		self._original_formatter = self.agent.formatter
+		self._attached_agents[agent] = {
+			"prompt": agent._sys_prompt,
+			"toolkit": agent.toolkit,
+			"model": agent.model,
+			"formatter": agent.formatter,
+		}
+		self.agent = agent
 		
 		if self._listen_prompt:
-			self.agent._sys_prompt = self.prompt
+			if (self.prompt is None or self.prompt == "") and agent._sys_prompt:
+				logger.debug(f"[{self.__class__.__name__}] Keeping agent prompt, Nacos prompt is empty")
+			else:
+				agent._sys_prompt = self.prompt
 			logger.debug(f"[{self.__class__.__name__}] Prompt configured for agent")
 			
 		if self._listen_mcp_server:
-			if self.agent.toolkit is not None:
-				self.toolkit.tools.update(self.agent.toolkit.tools)
-				self.toolkit.groups.update(self.agent.toolkit.groups)
-				self.agent.toolkit = self.toolkit
+			if agent.toolkit is not None:
+				self.toolkit.tools.update(agent.toolkit.tools)
+				self.toolkit.groups.update(agent.toolkit.groups)
+				agent.toolkit = self.toolkit
 			logger.debug(f"[{self.__class__.__name__}] Toolkit configured for agent")
 			
 		if self._listen_chat_model:
-			self.chat_model.set_backup_model(self._original_model)
-			self.agent.model = self.chat_model
-			self.agent.formatter = self.formatter
+			self.chat_model.set_backup_model(self._attached_agents[agent]["model"])
+			agent.model = self.chat_model
+			agent.formatter = self.formatter
 			logger.debug(f"[{self.__class__.__name__}] Chat model configured for agent")
 		
 		logger.info(f"[{self.__class__.__name__}] Agent '{agent.name}' successfully attached")
 
-	def detach_agent(self):
+	def detach_agent(self, agent: ReActAgent | None = None):
 		"""Detach Agent from Listener to stop receiving Nacos configuration updates.
 
-		Note: Listener must be initialized before calling this method.
+		Restores the prompt, model, formatter and toolkit the agent had when it
+		was attached.
 
-		Raises:
-			RuntimeError: If listener is not initialized
+		Args:
+			agent: Agent to detach. Detaches every attached agent if None
 		"""
-		agent = self.agent
-		self.agent = None
-		if agent is not None:
-			agent.model = self._original_model
-			agent.formatter = self._original_formatter
-			agent.toolkit = self._original_toolkit
-			agent._sys_prompt = self._original_prompt
-
-		self._original_model = None
-		self._original_prompt = None
-		self._original_toolkit = None
-		self._original_formatter = None
+		agents = list(self._attached_agents) if agent is None else [agent]
+		for _agent in agents:
+			originals = self._attached_agents.pop(_agent, None)
+			if originals is None:
+				continue
+			_agent.model = originals["model"]
+			_agent.formatter = originals["formatter"]
+			_agent.toolkit = originals["toolkit"]
+			_agent._sys_prompt = originals["prompt"]
+			logger.debug(f"[{self.__class__.__name__}] Agent '{_agent.name}' detached")
+
+		if self.agent is not None and self.agent not in self._attached_agents:
+			self.agent = None
 
 
 	async def _init_listen_mcp_server(self):
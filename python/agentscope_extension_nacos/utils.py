@@ -103,6 +103,57 @@ def validate_agent_name(agent_name: str) -> str:
 	return agent_name
 
 
+def coalesce_config_listener(listener, delay: float = 0.2):
+	"""Wrap a Nacos config listener so bursts of changes are applied once.
+	
+	Nacos invokes config listeners with ``(tenant, data_id, group, content)``
+	for every push. The returned listener only records the latest push per
+	``(group, data_id)`` and schedules a flush; after ``delay`` seconds the
+	wrapped listener runs once for each DataId that changed. Pushes that arrive
+	while a flush is running are picked up by the same flush task.
+	
+	Because the wrapped listener runs in a background task, exceptions it
+	raises are logged rather than propagated to the Nacos client.
+	
+	Args:
+		listener: Async Nacos config listener to wrap
+		delay: Coalescing window in seconds
+	
+	Returns:
+		An async listener with the same signature, suitable for ``add_listener``
+		and ``remove_listener``
+	
+	Example:
+		```python
+		listener = coalesce_config_listener(on_model_change)
+		await config_service.add_listener(data_id, group, listener)
+		```
+	"""
+	pending: dict[tuple[str, str], tuple] = {}
+	flush_task: asyncio.Task | None = None
+
+	async def flush():
+		while pending:
+			await asyncio.sleep(delay)
+			changes = list(pending.values())
+			pending.clear()
+			for tenant, data_id, group, content in changes:
+				try:
+					await listener(tenant, data_id, group, content)
+				except Exception as e:
+					logger.error(f"Config listener failed for data_id: {data_id}, group: {group}: {e}", exc_info=True)
+
+	async def coalesced_listener(tenant, data_id, group, content):
+		nonlocal flush_task
+		pending[(group, data_id)] = (tenant, data_id, group, content)
+		if flush_task is None or flush_task.done():
+			flush_task = asyncio.create_task(flush())
+		else:
+			logger.debug(f"Coalesced config change for data_id: {data_id}, group: {group}")
+
+	return coalesced_listener
+
+
 class AsyncRWLock:
 	"""Async Read-Write Lock.
 	
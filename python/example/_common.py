@@ -0,0 +1,226 @@
+"""
+Shared helpers for the Nacos examples.
+
+This module is not an example by itself; it collects the pieces that every
+interactive example needs so they are defined once instead of being copied
+into each script.
+"""
+
+import asyncio
+import contextlib
+import os
+import sys
+
+import httpx
+from agentscope.agent import AgentBase, UserAgent, UserInputBase, UserInputData
+from agentscope.formatter import DashScopeChatFormatter
+from agentscope.memory import InMemoryMemory
+from agentscope.message import TextBlock
+
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.patch_stdout import patch_stdout
+except ImportError:  # pragma: no cover - prompt_toolkit is optional
+    PromptSession = None
+    patch_stdout = None
+
+
+_shared_transport: httpx.AsyncHTTPTransport | None = None
+
+
+def get_shared_transport() -> httpx.AsyncHTTPTransport:
+    """Return the connection pool shared by every MCP client in the process.
+
+    Tool calls to the same host reuse keep-alive connections instead of new
+    TCP/TLS handshakes. The pool is created on first use so importing this
+    module stays free of side effects.
+    """
+    global _shared_transport
+    if _shared_transport is None:
+        _shared_transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=64, keepalive_expiry=75),
+        )
+    return _shared_transport
+
+
+async def close_shared_transport() -> None:
+    """Close the shared connection pool, if it was created.
+
+    The next ``get_shared_transport()`` call creates a fresh pool, so this is
+    safe to call at the end of every ``asyncio.run()``.
+    """
+    global _shared_transport
+    if _shared_transport is not None:
+        transport, _shared_transport = _shared_transport, None
+        await transport.aclose()
+
+
+# The formatter keeps no per-conversation state, so agents can share one
+FORMATTER = DashScopeChatFormatter()
+
+
+def new_memory() -> InMemoryMemory:
+    """Create the memory for a new agent; memory must never be shared."""
+    return InMemoryMemory()
+
+
+class SelectorStdinInput(UserInputBase):
+    """Read user input by watching stdin with the event loop's selector.
+
+    On POSIX the stdin file descriptor is registered with ``loop.add_reader``
+    and complete lines are queued as they arrive, so no executor thread is
+    blocked in ``input()``. Where the loop cannot watch stdin (Windows, or
+    stdin redirected from a regular file), falls back to running ``input()``
+    in the default thread pool.
+
+    A file descriptor can only have one reader per loop, so share the
+    module-level ``STDIN_INPUT`` instead of creating more instances.
+    """
+
+    def __init__(self, input_hint: str = "User Input: ") -> None:
+        self.input_hint = input_hint
+        self._fd: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+        self._buffer = b""
+        self._eof = False
+        self._use_selector = sys.platform != "win32"
+
+    def _ensure_reader(self) -> bool:
+        """Register stdin with the running loop; return False if unsupported."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return True
+        if not self._use_selector:
+            return False
+        try:
+            fd = sys.stdin.fileno()
+            loop.add_reader(fd, self._on_readable)
+        except (NotImplementedError, OSError, ValueError):
+            self._use_selector = False
+            return False
+        self._fd = fd
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        return True
+
+    def _put_line(self, line: bytes) -> None:
+        encoding = sys.stdin.encoding or "utf-8"
+        self._queue.put_nowait(line.rstrip(b"\r").decode(encoding, errors="replace"))
+
+    def _on_readable(self) -> None:
+        data = os.read(self._fd, 4096)
+        if not data:
+            # EOF: stop watching stdin, keep a final line that has no
+            # trailing newline (as input() does) and wake up any waiting turn
+            self._loop.remove_reader(self._fd)
+            if self._buffer:
+                self._put_line(self._buffer)
+                self._buffer = b""
+            self._eof = True
+            self._queue.put_nowait(None)
+            return
+        self._buffer += data
+        *lines, self._buffer = self._buffer.split(b"\n")
+        for line in lines:
+            self._put_line(line)
+
+    async def readline(self, prompt: str) -> str:
+        """Print ``prompt`` and return the next line from stdin.
+
+        Raises:
+            EOFError: If stdin is closed, like ``input()``
+        """
+        if not self._ensure_reader():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, input, prompt)
+        if self._eof and self._queue.empty():
+            raise EOFError
+        print(prompt, end="", flush=True)
+        line = await self._queue.get()
+        if line is None:
+            raise EOFError
+        return line
+
+    async def __call__(
+        self, agent_id: str, agent_name: str, structured_model=None, *args, **kwargs
+    ):
+        text_input = await self.readline(self.input_hint)
+        return UserInputData(
+            blocks_input=[TextBlock(type="text", text=text_input)],
+            structured_input=None,
+        )
+
+
+# The single stdin watcher shared by every input handler in the process
+STDIN_INPUT = SelectorStdinInput()
+
+
+class AsyncPromptInput(UserInputBase):
+    """Read user input without blocking the event loop.
+
+    Uses ``prompt_toolkit`` to wait on stdin from the event loop itself, so no
+    executor thread is parked on ``input()`` between turns. Falls back to the
+    shared ``STDIN_INPUT`` selector reader when ``prompt_toolkit`` is not
+    installed.
+    """
+
+    def __init__(self, input_hint: str = "User Input: ") -> None:
+        self.input_hint = input_hint
+        self._session = PromptSession() if PromptSession is not None else None
+
+    async def __call__(
+        self, agent_id: str, agent_name: str, structured_model=None, *args, **kwargs
+    ):
+        if self._session is not None:
+            text_input = await self._session.prompt_async(self.input_hint)
+        else:
+            text_input = await STDIN_INPUT.readline(self.input_hint)
+        return UserInputData(
+            blocks_input=[TextBlock(type="text", text=text_input)],
+            structured_input=None,
+        )
+
+
+async def run_chat_loop(user: UserAgent, agent: AgentBase) -> None:
+    """Chat between ``user`` and ``agent`` in the terminal until "exit".
+
+    A background task reads the next user turn while the agent is still
+    replying, so typing overlaps with the model's work instead of waiting
+    for it. Turns are handed over through a one-slot queue and answered in
+    order. End of input (Ctrl-D or a closed stdin) ends the chat like
+    "exit"; any other error raised while reading is re-raised here.
+    """
+    input_q: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+    async def reader() -> None:
+        while True:
+            try:
+                msg = await user(None)
+            except Exception as e:
+                # Hand the error to the main loop instead of dying silently
+                await input_q.put(e)
+                return
+            await input_q.put(msg)
+            if msg.get_text_content() == "exit":
+                return
+
+    # Keep the prompt line intact while the agent's reply streams to stdout
+    redirect = patch_stdout() if patch_stdout is not None else contextlib.nullcontext()
+    with redirect:
+        reader_task = asyncio.create_task(reader())
+        try:
+            while True:
+                msg = await input_q.get()
+                if isinstance(msg, EOFError):
+                    break
+                if isinstance(msg, Exception):
+                    raise msg
+                if msg.get_text_content() == "exit":
+                    break
+                await agent(msg)
+        finally:
+            reader_task.cancel()
+            # Let the reader unwind before stdout is restored
+            with contextlib.suppress(asyncio.CancelledError):
+                await reader_task
@@ -53,7 +53,7 @@ async def creating_a2a_agent() -> None:
         async def __call__(
             self, agent_id: str, agent_name: str, structured_model=None, *args, **kwargs
         ):
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             text_input = await loop.run_in_executor(None, input, self.input_hint)
             return UserInputData(
                 blocks_input=[TextBlock(type="text", text=text_input)],
@@ -15,6 +15,7 @@ Features:
 """
 
 import asyncio
+import os
 
 from agentscope.agent import UserAgent, UserInputBase, UserInputData
 from agentscope.message import TextBlock
@@ -33,7 +34,7 @@ async def creating_react_agent() -> None:
         ClientConfigBuilder()
         .server_address("localhost:8848")
         .namespace_id("public")
-        .log_level("DEBUG")  # Set to DEBUG level for detailed logs
+        .log_level(os.getenv("NACOS_LOG_LEVEL", "INFO"))  # Set NACOS_LOG_LEVEL=DEBUG for detailed logs
         .build()
     )
 
@@ -60,7 +61,7 @@ async def creating_react_agent() -> None:
         async def __call__(
             self, agent_id: str, agent_name: str, structured_model=None, *args, **kwargs
         ):
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             text_input = await loop.run_in_executor(None, input, self.input_hint)
             return UserInputData(
                 blocks_input=[TextBlock(type="text", text=text_input)],
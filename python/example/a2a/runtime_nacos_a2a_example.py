@@ -36,7 +36,7 @@ client_config = (
     ClientConfigBuilder()
     .server_address("localhost:8848")
     .namespace_id("public")
-    .log_level("DEBUG")  # Set to DEBUG level for detailed logs
+    .log_level(os.getenv("NACOS_LOG_LEVEL", "INFO"))  # Set NACOS_LOG_LEVEL=DEBUG for detailed logs
     .build()
 )
 
@@ -45,13 +45,13 @@ from agentscope_extension_nacos.nacos_react_agent import (
     NacosReActAgent,
 )
 from agentscope_extension_nacos.nacos_service_manager import NacosServiceManager
-from agentscope.agent import ReActAgent, UserAgent, UserInputBase, UserInputData
-from agentscope.formatter import DashScopeChatFormatter
-from agentscope.memory import InMemoryMemory
-from agentscope.message import Msg, TextBlock
+from agentscope.agent import ReActAgent, UserAgent
+from agentscope.message import Msg
 from agentscope.model import DashScopeChatModel
 from v2.nacos import ClientConfigBuilder
 
+from _common import FORMATTER, AsyncPromptInput, new_memory, run_chat_loop
+
 
 async def creating_react_agent() -> None:
     """Create and run a Nacos-managed ReAct agent."""
@@ -61,17 +61,20 @@ async def creating_react_agent() -> None:
         ClientConfigBuilder()
         .server_address("localhost:8848")
         .namespace_id("public")
-        .log_level("DEBUG")  # Set to DEBUG level for detailed logs
+        .log_level(os.getenv("NACOS_LOG_LEVEL", "INFO"))  # Set NACOS_LOG_LEVEL=DEBUG for detailed logs
         .build()
     )
 
     # Set as global configuration for all Nacos services
     NacosServiceManager.set_global_config(client_config)
 
-    # Create agent listener to manage Nacos configurations
-    # The listener will load and monitor configurations for agent "test-agent"
-    nacos_agent_listener = NacosAgentListener(agent_name="test-agent")
-    await nacos_agent_listener.initialize()
+    # Get the agent listener that manages Nacos configurations
+    # The listener loads and monitors configurations for agent "test-agent"
+    # and is shared with any other code in this process watching the same agent
+    nacos_agent_listener = await NacosAgentListener.get_or_create(
+        agent_name="test-agent",
+        nacos_client_config=client_config,
+    )
 
     # Create a fully Nacos-managed agent
     # All configurations (prompt, model, tools) come from Nacos
@@ -91,43 +94,19 @@ async def creating_react_agent() -> None:
     #         model_name="qwen-max",
     #         api_key=os.getenv("DASH_SCOPE_API_KEY"),
     #     ),
-    #     formatter=DashScopeChatFormatter(),
-    #     memory=InMemoryMemory(),
+    #     formatter=FORMATTER,
+    #     memory=new_memory(),
     # )
     #
     # # Attach to Nacos listener to enable configuration management
     # nacos_agent_listener.attach_agent(jarvis)
 
-    # Custom user input handler that runs in thread pool to avoid blocking
-    class ThreadedTerminalInput(UserInputBase):
-        """Run input() in a thread pool to avoid blocking the event loop."""
-
-        def __init__(self, input_hint: str = "User Input: ") -> None:
-            self.input_hint = input_hint
-
-        async def __call__(
-            self, agent_id: str, agent_name: str, structured_model=None, *args, **kwargs
-        ):
-            loop = asyncio.get_event_loop()
-            text_input = await loop.run_in_executor(None, input, self.input_hint)
-            return UserInputData(
-                blocks_input=[TextBlock(type="text", text=text_input)],
-                structured_input=None,
-            )
-
-    # Create user agent with custom input handler
+    # Create user agent with a non-blocking terminal input handler
     user = UserAgent(name="user")
-    user.override_instance_input_method(ThreadedTerminalInput())
+    user.override_instance_input_method(AsyncPromptInput())
 
     # Start conversation loop
-    msg = None
-    msg = await user(msg)
-
-    while True:
-        msg = await jarvis(msg)
-        msg = await user(msg)
-        if msg.get_text_content() == "exit":
-            break
+    await run_chat_loop(user, jarvis)
 
 
 if __name__ == "__main__":
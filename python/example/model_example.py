@@ -32,10 +32,7 @@ import os
 
 from agentscope_extension_nacos.model.nacos_chat_model import NacosChatModel
 from agentscope_extension_nacos.nacos_service_manager import NacosServiceManager
-from agentscope.agent import ReActAgent, UserAgent, UserInputBase, UserInputData
-from agentscope.formatter import DashScopeChatFormatter
-from agentscope.memory import InMemoryMemory
-from agentscope.message import TextBlock
+from agentscope.agent import ReActAgent, UserAgent
 from v2.nacos import ClientConfigBuilder
 from agentscope_extension_nacos.mcp.agentscope_nacos_mcp import (
     NacosHttpStatelessClient,
@@ -44,83 +41,86 @@ from agentscope_extension_nacos.mcp.agentscope_nacos_mcp import (
 # Use DynamicToolkit instead of Toolkit to support dynamic tool updates
 from agentscope_extension_nacos.mcp.agentscope_dynamic_toolkit import DynamicToolkit
 
-
-# Configure Nacos connection
-client_config = (
-    ClientConfigBuilder()
-    .server_address("localhost:8848")
-    .namespace_id("public")
-    .log_level("DEBUG")  # Set to DEBUG level for detailed logs
-    .build()
+from _common import (
+    FORMATTER,
+    AsyncPromptInput,
+    close_shared_transport,
+    get_shared_transport,
+    new_memory,
+    run_chat_loop,
 )
 
-# Set as global configuration
-NacosServiceManager.set_global_config(client_config)
-
 
 async def creating_react_agent() -> None:
     """Create a ReAct agent with Nacos-managed model and MCP tools."""
 
+    # Configure Nacos connection
+    client_config = (
+        ClientConfigBuilder()
+        .server_address("localhost:8848")
+        .namespace_id("public")
+        .log_level(os.getenv("NACOS_LOG_LEVEL", "INFO"))  # Set NACOS_LOG_LEVEL=DEBUG for detailed logs
+        .build()
+    )
+
+    # Set as global configuration
+    NacosServiceManager.set_global_config(client_config)
+
+    # Connection pool shared by both MCP clients
+    transport = get_shared_transport()
+
     # Create MCP clients from Nacos MCP Registry
     # Stateless client: suitable for low-frequency calls
-    stateless_client = NacosHttpStatelessClient("nacos-mcp-1")
-    # Stateful client: suitable for high-frequency calls
-    stateful_client = NacosHttpStatefulClient("nacos-mcp-2")
-
-    # Create dynamic toolkit that auto-syncs with Nacos
-    toolkit = DynamicToolkit()
-    await stateful_client.connect()
-    await toolkit.register_mcp_client(stateful_client)
-    await toolkit.register_mcp_client(stateless_client)
-
-    # Create Nacos-managed chat model
-    # Model configuration will be loaded from Nacos and supports hot updates
-    # The model will automatically switch when configuration changes in Nacos
-    model = NacosChatModel(
-        agent_name="test-agent",  # Corresponds to Group: ai-agent-test-agent
-        stream=True,
+    stateless_client = NacosHttpStatelessClient(
+        nacos_client_config=client_config,
+        name="nacos-mcp-1",
+        transport=transport,
     )
-
-    # Build agent with Nacos-managed model and dynamic toolkit
-    jarvis = ReActAgent(
-        name="Jarvis",
-        sys_prompt="You are an AI assistant",
-        model=model,
-        formatter=DashScopeChatFormatter(),
-        toolkit=toolkit,
-        memory=InMemoryMemory(),
+    # Stateful client: suitable for high-frequency calls
+    stateful_client = NacosHttpStatefulClient(
+        nacos_client_config=client_config,
+        name="nacos-mcp-2",
+        transport=transport,
     )
 
-    # Custom user input handler that runs in thread pool to avoid blocking
-    class ThreadedTerminalInput(UserInputBase):
-        """Run input() in a thread pool to avoid blocking the event loop."""
-
-        def __init__(self, input_hint: str = "User Input: ") -> None:
-            self.input_hint = input_hint
-
-        async def __call__(
-            self, agent_id: str, agent_name: str, structured_model=None, *args, **kwargs
-        ):
-            loop = asyncio.get_event_loop()
-            text_input = await loop.run_in_executor(None, input, self.input_hint)
-            return UserInputData(
-                blocks_input=[TextBlock(type="text", text=text_input)],
-                structured_input=None,
-            )
-
-    # Create user agent with custom input handler
-    user = UserAgent(name="user")
-    user.override_instance_input_method(ThreadedTerminalInput())
-
-    # Start conversation loop
-    msg = None
-    msg = await user(msg)
-
-    while True:
-        msg = await jarvis(msg)
-        msg = await user(msg)
-        if msg.get_text_content() == "exit":
-            break
+    try:
+        # Create dynamic toolkit that auto-syncs with Nacos
+        toolkit = DynamicToolkit()
+        await stateful_client.connect()
+        await asyncio.gather(
+            toolkit.register_mcp_client(stateful_client),
+            toolkit.register_mcp_client(stateless_client),
+        )
+
+        # Create Nacos-managed chat model
+        # Model configuration will be loaded from Nacos and supports hot updates
+        # The model will automatically switch when configuration changes in Nacos
+        model = NacosChatModel(
+            agent_name="test-agent",  # Corresponds to Group: ai-agent-test-agent
+            stream=True,
+        )
+
+        # Build agent with Nacos-managed model and dynamic toolkit
+        jarvis = ReActAgent(
+            name="Jarvis",
+            sys_prompt="You are an AI assistant",
+            model=model,
+            formatter=FORMATTER,
+            toolkit=toolkit,
+            memory=new_memory(),
+        )
+
+        # Create user agent with a non-blocking terminal input handler
+        user = UserAgent(name="user")
+        user.override_instance_input_method(AsyncPromptInput())
+
+        # Start conversation loop
+        await run_chat_loop(user, jarvis)
+    finally:
+        # Close the stateful session before releasing the pool it runs on
+        if stateful_client.is_connected:
+            await stateful_client.close()
+        await close_shared_transport()
 
 
 if __name__ == "__main__":
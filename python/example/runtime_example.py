@@ -15,6 +15,8 @@ Features:
 """
 
 import asyncio
+import os
+import signal
 from contextlib import asynccontextmanager
 
 from agentscope_runtime.engine import Runner, LocalDeployManager
@@ -34,16 +36,10 @@ client_config = (
     ClientConfigBuilder()
     .server_address("localhost:8848")
     .namespace_id("public")
-    .log_level("DEBUG")  # Set to DEBUG level for detailed logs
+    .log_level(os.getenv("NACOS_LOG_LEVEL", "INFO"))  # Set NACOS_LOG_LEVEL=DEBUG for detailed logs
     .build()
 )
 
-# Create Nacos agent listener
-# This will load agent configurations from Nacos
-nacos_agent_listener = NacosAgentListener(
-    nacos_client_config=client_config, agent_name="test-agent"
-)
-
 agent: AgentScopeAgent | None = None
 
 print("✅ AgentScope agent created successfully")
@@ -54,8 +50,11 @@ async def create_runner():
     """Create and initialize the agent runner."""
     global agent
     
-    # Initialize Nacos listener to load configurations
-    await nacos_agent_listener.initialize()
+    # Get the shared Nacos agent listener, loading configurations on first use
+    nacos_agent_listener = await NacosAgentListener.get_or_create(
+        agent_name="test-agent",
+        nacos_client_config=client_config,
+    )
     
     # Create AgentScope agent with Nacos-managed configurations
     agent = AgentScopeAgent(
@@ -109,14 +108,33 @@ async def deploy_agent(runner):
 
 
 async def run_deployment():
-    """Run the deployment and keep the service alive."""
+    """Run the deployment and keep the service alive until SIGINT/SIGTERM."""
     async with create_runner() as runner:
         deploy_manager = await deploy_agent(runner)
 
-    # Keep the service running
-    # In production, you'd handle this differently (e.g., with proper shutdown handlers)
-    print("🏃 Service is running...")
-    await asyncio.sleep(1000)
+        # Keep the service running inside the runner context until asked to stop
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        installed = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except NotImplementedError:
+                # Signal handlers are unavailable on Windows event loops;
+                # Ctrl+C still ends the process there via KeyboardInterrupt
+                pass
+            else:
+                installed.append(sig)
+
+        print("🏃 Service is running... (press Ctrl+C to stop)")
+        try:
+            await stop.wait()
+        finally:
+            # Restore default handling so a second Ctrl+C can interrupt a hung stop
+            for sig in installed:
+                loop.remove_signal_handler(sig)
+            print("🛑 Shutting down...")
+            await deploy_manager.stop()
 
     return deploy_manager
 
@@ -0,0 +1,47 @@
+"""
+Test module for agentscope_extension_nacos.utils
+"""
+
+import asyncio
+import unittest
+
+from agentscope_extension_nacos.utils import coalesce_config_listener
+
+
+class TestCoalesceConfigListener(unittest.IsolatedAsyncioTestCase):
+    """Test cases for coalesce_config_listener"""
+
+    async def test_burst_is_applied_once_per_data_id(self):
+        """Test that a burst of pushes calls the listener once per DataId with the latest content"""
+        calls = []
+
+        async def listener(tenant, data_id, group, content):
+            calls.append((data_id, content))
+
+        coalesced = coalesce_config_listener(listener, delay=0.01)
+        for i in range(10):
+            await coalesced("public", "model.json", "ai-agent-test", f"model-{i}")
+            await coalesced("public", "prompt.json", "ai-agent-test", f"prompt-{i}")
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(
+            sorted(calls),
+            [("model.json", "model-9"), ("prompt.json", "prompt-9")],
+        )
+
+    async def test_listener_errors_are_logged(self):
+        """Test that listener errors are logged instead of raised"""
+
+        async def listener(tenant, data_id, group, content):
+            raise ValueError("bad config")
+
+        coalesced = coalesce_config_listener(listener, delay=0.01)
+        with self.assertLogs("agentscope_extension_nacos.utils", level="ERROR") as logs:
+            await coalesced("public", "model.json", "ai-agent-test", "{}")
+            await asyncio.sleep(0.05)
+
+        self.assertIn("bad config", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()